@@ -1 +0,0 @@
-# empty or simple marker
\ No newline at end of file
@@ -1,14 +1,21 @@
 # app/auth.py
 
-from datetime import datetime, timedelta
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+import jwt
+import orjson
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session, joinedload
 
 from app import models
 from app.database import get_db
@@ -20,109 +27,239 @@ from app.schemas import TokenData
 # Password hashing
 # --------------------------------------------------------------------
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2id; existing bcrypt hashes still verify and are
+# upgraded on the next successful login (see authenticate_user).
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated=["bcrypt"],
+    argon2__type="ID",
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
+# Key derivation runs on a dedicated pool sized to the CPU count. Callers
+# still block on .result(), so this is a concurrency limiter: at most one
+# KDF per core runs at once and a login burst queues instead of
+# oversubscribing the CPU. argon2-cffi and bcrypt release the GIL while
+# hashing, so the pool's threads do hash in parallel.
+_CRYPT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="crypt"
+)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return pwd_context.verify(plain_password, hashed_password)
+    except ValueError:
+        # Unrecognised or malformed hash
+        return False
+
+
+# Anything failing these checks cannot verify, so it is rejected before any
+# KDF work. The length cap stops oversized passwords being used to burn CPU.
+_HASH_PREFIXES = ("$2", "$argon2")
+_MIN_HASH_LEN = 50
+_MAX_PASSWORD_LEN = 1024
+
+
+def _can_verify(plain_password: str, hashed_password: Optional[str]) -> bool:
+    return (
+        bool(plain_password)
+        and len(plain_password) <= _MAX_PASSWORD_LEN
+        and bool(hashed_password)
+        and len(hashed_password) >= _MIN_HASH_LEN
+        and hashed_password.startswith(_HASH_PREFIXES)
+    )
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Return True if password matches hash."""
-    if not hashed_password:
+    if not _can_verify(plain_password, hashed_password):
         return False
-    return pwd_context.verify(plain_password, hashed_password)
+    return _CRYPT_POOL.submit(_verify, plain_password, hashed_password).result()
 
 
 def get_password_hash(password: str) -> str:
     """Hash a plaintext password."""
-    return pwd_context.hash(password)
+    return _CRYPT_POOL.submit(pwd_context.hash, password).result()
+
+
+# Verified against when the user does not exist, so unknown identifiers cost
+# the same hashing work as a wrong password and do not leak via timing.
+DUMMY_PASSWORD_HASH = pwd_context.hash("dummy-password")
 
 
 # --------------------------------------------------------------------
 # JWT helpers
 # --------------------------------------------------------------------
 
+class OrjsonJWT(jwt.PyJWT):
+    """PyJWT using orjson for the claims payload (headers stay on stdlib json)."""
+
+    def _encode_payload(self, payload, headers=None, json_encoder=None) -> bytes:
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded):
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}")
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+# Decoder, key, algorithm list and options are built once instead of per call.
+_JWT = OrjsonJWT()
+_SECRET = settings.SECRET_KEY
+_ALG = settings.ALGORITHM
+_JWT_ALGORITHMS = [_ALG]
+_EXP_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_JWT_OPTIONS = {"verify_signature": True, "require": ["exp", "sub"]}
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a signed JWT access token."""
-    to_encode = data.copy()
-    expire = datetime.utcnow() + (
-        expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _EXP_SECONDS
+    return _JWT.encode(
+        {**data, "exp": int(time.time()) + ttl}, _SECRET, algorithm=_ALG
     )
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+# Verified tokens are remembered briefly so clients re-sending the same bearer
+# token skip signature verification and JSON parsing. Keys are digests, so raw
+# tokens never sit in memory; entries also carry the token's own expiry.
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=60)
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
 
 
 def decode_token(token: str) -> TokenData:
     """Decode a JWT and return TokenData. Raises ValueError if invalid."""
+    key = _token_cache_key(token)
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        exp, token_data = cached
+        if exp > time.time():
+            return token_data
+
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        sub = payload.get("sub")
-        if sub is None:
-            raise ValueError("Invalid token: missing subject")
-        return TokenData(user_id=int(sub))
-    except JWTError as e:
+        payload = _JWT.decode(
+            token, _SECRET, algorithms=_JWT_ALGORITHMS, options=_JWT_OPTIONS
+        )
+        token_data = TokenData(user_id=int(payload["sub"]))
+    except jwt.PyJWTError as e:
         raise ValueError(f"Invalid token: {e}")
 
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[key] = (payload["exp"], token_data)
+    return token_data
+
 
 # --------------------------------------------------------------------
 # User lookup
 # --------------------------------------------------------------------
 
+# Login answers with the user's roles, so fetch them in the same query. Built
+# once at import like the current-user lookup below; each login only binds.
+_USER_BY_EMAIL_STMT = (
+    select(models.ADPUser)
+    .options(joinedload(models.ADPUser.roles))
+    .where(models.ADPUser.email == bindparam("ident"))
+)
+_USER_BY_USERNAME_STMT = (
+    select(models.ADPUser)
+    .options(joinedload(models.ADPUser.roles))
+    .where(models.ADPUser.username == bindparam("ident"))
+)
+
+
 def get_user_by_identifier(db: Session, identifier: str) -> Optional[models.ADPUser]:
     """Fetch a user by email or username."""
-    return (
-        db.query(models.ADPUser)
-        .filter(
-            or_(
-                models.ADPUser.email == identifier,
-                models.ADPUser.username == identifier,
-            )
-        )
-        .first()
-    )
+    # Emails always contain "@" and usernames never do, so a single unique
+    # index is enough instead of an OR across both columns.
+    stmt = _USER_BY_EMAIL_STMT if "@" in identifier else _USER_BY_USERNAME_STMT
+    return db.execute(stmt, {"ident": identifier}).unique().scalar_one_or_none()
 
 
 def authenticate_user(db: Session, identifier: str, password: str) -> Optional[models.ADPUser]:
     """Return user if credentials are valid, otherwise None."""
     user = get_user_by_identifier(db, identifier)
-    if not user:
+    if not user or not user.password_hash:
+        verify_password(password, DUMMY_PASSWORD_HASH)
+        return None
+    if not _can_verify(password, user.password_hash):
         return None
-    if not verify_password(password, user.password_hash):
+    valid, new_hash = _CRYPT_POOL.submit(
+        pwd_context.verify_and_update, password, user.password_hash
+    ).result()
+    if not valid:
         return None
+    if new_hash:
+        user.password_hash = new_hash
+        db.commit()
     return user
 
 
+# The two per-request lookups are built once; each call only binds the id.
+# role_code is the FK on the junction table itself, so adp_role isn't joined.
+_USER_ROLES_STMT = select(models.ADPUserRole.role_code).where(
+    models.ADPUserRole.user_id == bindparam("uid")
+)
+_CURRENT_USER_STMT = (
+    select(models.ADPUser)
+    .options(
+        joinedload(models.ADPUser.roles),
+        joinedload(models.ADPUser.account),
+    )
+    .where(models.ADPUser.user_id == bindparam("uid"))
+)
+
+
 def get_user_roles(db: Session, user_id: int) -> list[str]:
     """Get role codes for a user."""
-    roles = (
-        db.query(models.ADPUserRole, models.ADPRole)
-        .join(models.ADPRole, models.ADPRole.role_code == models.ADPUserRole.role_code)
-        .filter(models.ADPUserRole.user_id == user_id)
-        .all()
-    )
-    return [r.ADPRole.role_code for r in roles]
+    return list(db.execute(_USER_ROLES_STMT, {"uid": user_id}).scalars())
 
 
 # --------------------------------------------------------------------
 # Dependencies
 # --------------------------------------------------------------------
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> models.ADPUser:
-    """Get the current authenticated user from JWT token."""
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    # A fresh instance per raise: re-raising a shared one would keep growing
+    # its __traceback__ and pin every failed request's frames.
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
+
+# Plain def: FastAPI runs it in the threadpool, keeping the blocking session
+# call off the event loop.
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> models.ADPUser:
+    """Get the current authenticated user from JWT token."""
     try:
         token_data = decode_token(token)
     except ValueError:
-        raise credentials_exception
+        raise _credentials_exception() from None
 
-    user = db.query(models.ADPUser).filter(models.ADPUser.user_id == token_data.user_id).first()
+    user = (
+        db.execute(_CURRENT_USER_STMT, {"uid": token_data.user_id})
+        .unique()
+        .scalar_one_or_none()
+    )
     if user is None or not user.is_active:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
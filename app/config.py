@@ -1,11 +1,21 @@
 import os
+from typing import List
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 3600  # seconds
     SECRET_KEY: str = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    ARGON2_TIME_COST: int = 3
+    ARGON2_PARALLELISM: int = 4
+    CORS_ORIGINS: List[str] = ["*"]  # JSON list in env, e.g. '["https://app.example.com"]'
+    AUTO_MIGRATE: bool = False  # create missing tables at startup (local dev only)
+    DEBUG_QUERY_COUNT: bool = False  # add X-Query-Count to responses (dev only)
 
     class Config:
         env_file = ".env"
@@ -1,12 +1,52 @@
-from sqlalchemy import create_engine
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import create_engine, event, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+_url = make_url(settings.DATABASE_URL)
+_driver_options = {}
+if _url.get_backend_name() == "postgresql" and _url.get_driver_name() == "psycopg2":
+    # executemany INSERTs go out as multi-row VALUES pages, and UPDATE/DELETE
+    # executemany through psycopg2's execute_batch, instead of a round trip
+    # per row (admin bulk endpoints)
+    _driver_options = dict(
+        executemany_mode="values_plus_batch",
+        insertmanyvalues_page_size=1000,
+        executemany_batch_page_size=500,
+    )
+
+engine = create_engine(
+    _url,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    **_driver_options,
+)
+# Objects stay loaded after commit; a session only lives for one request, and
+# routes that need DB-generated values after a commit call db.refresh().
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 Base = declarative_base()
 
+# Per-request SQL statement counter, enabled with DEBUG_QUERY_COUNT. main.py
+# sets a fresh [0] for each request and reports it in X-Query-Count, so an
+# N+1 regression shows up as a count that grows with the result size.
+query_counter: ContextVar[Optional[list]] = ContextVar("query_counter", default=None)
+
+if settings.DEBUG_QUERY_COUNT:
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_query(conn, cursor, statement, parameters, context, executemany):
+        counter = query_counter.get()
+        if counter is not None:
+            counter[0] += 1
+
+# FastAPI caches this dependency per request, so get_current_user and the
+# route handler share one session (and one pooled connection).
 def get_db():
     db = SessionLocal()
     try:
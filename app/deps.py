@@ -1,73 +1,40 @@
-from datetime import datetime, timedelta
 from typing import List
-import bcrypt
-from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
-
-from .config import settings
+from fastapi import Depends, HTTPException
+
+# Hashing, JWT handling and the current-user lookup live in app.auth; they are
+# re-exported here so routers keep importing request dependencies from one place.
+from .auth import (
+    authenticate_user,
+    create_access_token,
+    get_current_user,
+    get_password_hash as hash_password,
+    oauth2_scheme,
+)
 from .database import get_db
-from .models import ADPUser, ADPUserRole
-
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
-
-
-def hash_password(password: str) -> str:
-    salt = bcrypt.gensalt(rounds=12)
-    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+from .models import ADPUser, ADPAccount
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    try:
-        return bcrypt.checkpw(
-            plain_password.encode('utf-8'),
-            hashed_password.encode('utf-8')
-        )
-    except Exception:
-        return False
+def get_current_account(user: ADPUser = Depends(get_current_user)) -> ADPAccount:
+    if user.account is None:
+        raise HTTPException(status_code=400, detail="No account found")
+    return user.account
 
 
-def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
-    to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+def get_user_roles(user: ADPUser) -> List[str]:
+    # get_current_user loads roles in the same query as the user
+    return [ur.role_code for ur in user.roles]
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> ADPUser:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    
-    user = db.query(ADPUser).filter(ADPUser.user_id == int(user_id)).first()
-    if user is None:
-        raise credentials_exception
-    return user
+def require_role(*required_roles: str, detail: str = "Insufficient permissions"):
+    """Dependency factory: the user must hold at least one of required_roles."""
+    required = frozenset(required_roles)
 
+    def checker(user: ADPUser = Depends(get_current_user)) -> ADPUser:
+        if required.isdisjoint(get_user_roles(user)):
+            raise HTTPException(status_code=403, detail=detail)
+        return user
 
-def get_user_roles(user: ADPUser, db: Session) -> List[str]:
-    user_roles = db.query(ADPUserRole).filter(ADPUserRole.user_id == user.user_id).all()
-    return [ur.role_code for ur in user_roles]
+    return checker
 
 
-def require_admin(
-    user: ADPUser = Depends(get_current_user),
-    db: Session = Depends(get_db)
-) -> ADPUser:
-    roles = get_user_roles(user, db)
-    if "ADMIN" not in roles:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    return user
+require_admin = require_role("ADMIN", detail="Admin access required")
@@ -1,26 +1,58 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .config import settings
+from .database import Base, engine, query_counter
 from .routers import auth, series, feedback, watchlist, reference, admin
 
-app = FastAPI(title="Netflix Hub API", version="1.0.0")
 
-# CORS - Allow all origins
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The schema is managed outside the app; creating tables is opt-in so
+    # workers don't introspect every table on boot.
+    if settings.AUTO_MIGRATE:
+        Base.metadata.create_all(bind=engine)
+    yield
+
+
+app = FastAPI(title="Netflix Hub API", version="1.0.0", lifespan=lifespan)
+
+# CORS - fixed method/header lists let preflights use a prebuilt response
+# instead of echoing the requested headers back each time
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With"],
 )
 
-# Include routers
-app.include_router(auth.router, prefix="/auth", tags=["Auth"])
-app.include_router(series.router, prefix="/series", tags=["Series"])
-app.include_router(feedback.router, prefix="/series", tags=["Feedback"])
-app.include_router(watchlist.router, prefix="/me", tags=["Watchlist"])
-app.include_router(reference.router, prefix="/reference", tags=["Reference"])
-app.include_router(admin.router, tags=["Admin"])
+if settings.DEBUG_QUERY_COUNT:
+    @app.middleware("http")
+    async def count_queries(request, call_next):
+        counter = [0]
+        token = query_counter.set(counter)
+        try:
+            response = await call_next(request)
+        finally:
+            query_counter.reset(token)
+        response.headers["X-Query-Count"] = str(counter[0])
+        return response
+
+
+# Include routers: (module, prefix, tag)
+ROUTERS = (
+    (auth, "/auth", "Auth"),
+    (series, "/series", "Series"),
+    (feedback, "/series", "Feedback"),
+    (watchlist, "/me", "Watchlist"),
+    (reference, "/reference", "Reference"),
+    (admin, "", "Admin"),
+)
+for module, prefix, tag in ROUTERS:
+    app.include_router(module.router, prefix=prefix, tags=[tag])
 
 
 @app.get("/")
@@ -1,25 +1,47 @@
-from datetime import datetime, date
 from sqlalchemy import (
     Column, BigInteger, Integer, String, Boolean, Text, Date,
-    ForeignKey, SmallInteger, Numeric, DateTime, UniqueConstraint, CheckConstraint, CHAR
+    ForeignKey, SmallInteger, Numeric, DateTime, UniqueConstraint, CheckConstraint, CHAR,
+    Identity, Index, DDL, event, func, text
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import CITEXT
+from sqlalchemy.orm import deferred, relationship
 from .database import Base
 
 
+# Case-insensitive text on PostgreSQL, so login lookups match regardless of
+# case while still probing the plain unique index on the column.
+CaseInsensitiveString = String().with_variant(CITEXT(), "postgresql")
+
+event.listen(
+    Base.metadata, "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS citext").execute_if(dialect="postgresql"),
+)
+
+
+# Surrogate keys come from a GENERATED BY DEFAULT identity: the cached sequence
+# hands out ids inside the INSERT, with no MAX(id) probe and no race between
+# concurrent inserts. SQLite only autoincrements an INTEGER PRIMARY KEY.
+def _id_column():
+    return Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(start=1, cache=50),
+        primary_key=True,
+    )
+
+
 class ADPUser(Base):
     __tablename__ = "adp_user"
-    user_id = Column(BigInteger, primary_key=True)
-    email = Column(String, nullable=False, unique=True)
-    username = Column(String, nullable=False, unique=True)
+    user_id = _id_column()
+    email = Column(CaseInsensitiveString, nullable=False, unique=True)
+    username = Column(CaseInsensitiveString, nullable=False, unique=True)
     password_hash = Column(String, nullable=False)
     is_active = Column(Boolean, nullable=False, default=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     last_login_at = Column(DateTime(timezone=True))
     
-    roles = relationship("ADPUserRole", back_populates="user")
-    account = relationship("ADPAccount", back_populates="user", uselist=False)
+    roles = relationship("ADPUserRole", back_populates="user", passive_deletes=True, lazy="raise")
+    account = relationship("ADPAccount", back_populates="user", uselist=False, lazy="joined")
 
 
 class ADPRole(Base):
@@ -31,7 +53,7 @@ class ADPRole(Base):
 
 class ADPUserRole(Base):
     __tablename__ = "adp_user_role"
-    user_id = Column(BigInteger, ForeignKey("adp_user.user_id"), primary_key=True)
+    user_id = Column(BigInteger, ForeignKey("adp_user.user_id", ondelete="CASCADE"), primary_key=True)
     role_code = Column(String, ForeignKey("adp_role.role_code"), primary_key=True)
     user = relationship("ADPUser", back_populates="roles")
     role = relationship("ADPRole", back_populates="users")
@@ -57,7 +79,7 @@ class ADPSeriesType(Base):
 
 class ADPAccount(Base):
     __tablename__ = "adp_account"
-    account_id = Column(BigInteger, primary_key=True)
+    account_id = _id_column()
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
     address_line1 = Column(String(255), nullable=False)
@@ -66,13 +88,13 @@ class ADPAccount(Base):
     postal_code = Column(String(20), nullable=False)
     opened_date = Column(Date, nullable=False)
     monthly_service_fee = Column(Numeric(10,2), nullable=False, default=9.99)
-    adp_country_country_code = Column(String(10), ForeignKey("adp_country.country_code"), nullable=False)
+    adp_country_country_code = Column(String(3), ForeignKey("adp_country.country_code"), nullable=False)
     adp_user_user_id = Column(BigInteger, ForeignKey("adp_user.user_id"), nullable=False, unique=True)
     
-    user = relationship("ADPUser", back_populates="account")
-    country = relationship("ADPCountry")
-    feedbacks = relationship("ADPFeedback", back_populates="account")
-    watchlist_items = relationship("ADPWatchlist", back_populates="account")
+    user = relationship("ADPUser", back_populates="account", lazy="raise")
+    country = relationship("ADPCountry", lazy="raise")
+    feedbacks = relationship("ADPFeedback", back_populates="account", lazy="raise")
+    watchlist_items = relationship("ADPWatchlist", back_populates="account", lazy="raise")
 
 
 # ============================================
@@ -81,14 +103,14 @@ class ADPAccount(Base):
 
 class ADPProductionHouse(Base):
     __tablename__ = "adp_production_house"
-    house_id = Column(BigInteger, primary_key=True)
+    house_id = _id_column()
     name = Column(String(255), nullable=False)
     address_line1 = Column(String(255))
     city = Column(String(100))
     state_province = Column(String(100))
     postal_code = Column(String(20))
     year_established = Column(Integer)
-    adp_country_country_code = Column(String(10), ForeignKey("adp_country.country_code"))
+    adp_country_country_code = Column(String(3), ForeignKey("adp_country.country_code"))
     
     country = relationship("ADPCountry")
     contracts = relationship("ADPContract", back_populates="production_house")
@@ -97,7 +119,7 @@ class ADPProductionHouse(Base):
 
 class ADPProducer(Base):
     __tablename__ = "adp_producer"
-    producer_id = Column(BigInteger, primary_key=True)
+    producer_id = _id_column()
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
     email = Column(String(255))
@@ -106,22 +128,30 @@ class ADPProducer(Base):
     city = Column(String(100))
     state_province = Column(String(100))
     postal_code = Column(String(20))
-    adp_country_country_code = Column(String(10), ForeignKey("adp_country.country_code"))
+    adp_country_country_code = Column(String(3), ForeignKey("adp_country.country_code"))
     
     country = relationship("ADPCountry")
-    production_houses = relationship("ADPProducerHouse", back_populates="producer")
+    production_houses = relationship("ADPProducerHouse", back_populates="producer", passive_deletes=True)
+
+    __table_args__ = (
+        UniqueConstraint('email', name='uk_adp_producer_email'),
+    )
 
 
 class ADPProducerHouse(Base):
     """Bridge table: Producer <-> Production House (many-to-many)"""
     __tablename__ = "adp_producer_house"
-    adp_producer_producer_id = Column(BigInteger, ForeignKey("adp_producer.producer_id"), primary_key=True)
+    adp_producer_producer_id = Column(BigInteger, ForeignKey("adp_producer.producer_id", ondelete="CASCADE"), primary_key=True)
     adp_production_house_house_id = Column(BigInteger, ForeignKey("adp_production_house.house_id"), primary_key=True)
     role_desc = Column(String(80))  # e.g., 'Executive Producer', 'Line Producer'
     
     producer = relationship("ADPProducer", back_populates="production_houses")
     production_house = relationship("ADPProductionHouse", back_populates="producers")
 
+    __table_args__ = (
+        Index('ix_adp_producer_house_house', 'adp_production_house_house_id'),
+    )
+
 
 # ============================================
 # SERIES & RELATED
@@ -129,53 +159,70 @@ class ADPProducerHouse(Base):
 
 class ADPSeries(Base):
     __tablename__ = "adp_series"
-    series_id = Column(BigInteger, primary_key=True)
+    series_id = _id_column()
     name = Column(String(255), nullable=False)
-    num_episodes = Column(Integer, nullable=False, default=0)
+    num_episodes = Column(SmallInteger, nullable=False, default=0)
     release_date = Column(Date, nullable=False)
-    adp_language_language_code = Column(String(10), ForeignKey("adp_language.language_code"), nullable=False)
+    adp_language_language_code = Column(String(8), ForeignKey("adp_language.language_code"), nullable=False)
     origin_country = Column(String(100), nullable=False)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    description = Column(Text)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    # Long text is left out of plain series loads (existence checks, name
+    # lookups); routes that return it undefer the "detail" group.
+    description = deferred(Column(Text), group="detail", raiseload=True)
     maturity_rating = Column(String(10))
-    poster_url = Column(Text)
-    banner_url = Column(Text)
+    poster_url = deferred(Column(Text), group="detail", raiseload=True)
+    banner_url = deferred(Column(Text), group="detail", raiseload=True)
     average_rating = Column(Numeric(3,2), nullable=False, default=0)
     rating_count = Column(Integer, nullable=False, default=0)
     
-    language = relationship("ADPLanguage")
-    genres = relationship("ADPSeriesGenre", back_populates="series", cascade="all, delete-orphan")
-    dubs = relationship("ADPSeriesDub", back_populates="series", cascade="all, delete-orphan")
-    subs = relationship("ADPSeriesSub", back_populates="series", cascade="all, delete-orphan")
-    feedbacks = relationship("ADPFeedback", back_populates="series", cascade="all, delete-orphan")
-    watchlist_entries = relationship("ADPWatchlist", back_populates="series", cascade="all, delete-orphan")
-    episodes = relationship("ADPEpisode", back_populates="series", cascade="all, delete-orphan")
-    contracts = relationship("ADPContract", back_populates="series")
-    available_countries = relationship("ADPSeriesCountry", back_populates="series", cascade="all, delete-orphan")
+    language = relationship("ADPLanguage", lazy="raise")
+    genres = relationship("ADPSeriesGenre", back_populates="series", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    dubs = relationship("ADPSeriesDub", back_populates="series", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    subs = relationship("ADPSeriesSub", back_populates="series", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    feedbacks = relationship("ADPFeedback", back_populates="series", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    watchlist_entries = relationship("ADPWatchlist", back_populates="series", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    episodes = relationship("ADPEpisode", back_populates="series", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    contracts = relationship("ADPContract", back_populates="series", lazy="raise")
+    available_countries = relationship("ADPSeriesCountry", back_populates="series", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+
+    # Read-only shortcuts past the bridge tables, for serialization: loads the
+    # genre/language rows directly instead of a bridge object per row.
+    genre_types = relationship("ADPSeriesType", secondary="adp_series_genre", viewonly=True, lazy="raise")
+    dub_languages = relationship("ADPLanguage", secondary="adp_series_dub", viewonly=True, lazy="raise")
+    sub_languages = relationship("ADPLanguage", secondary="adp_series_sub", viewonly=True, lazy="raise")
+
+    # Language filter on the series listing
+    __table_args__ = (
+        Index('ix_adp_series_language', 'adp_language_language_code'),
+    )
 
 
 class ADPSeriesCountry(Base):
     """Bridge table: Series available in multiple countries"""
     __tablename__ = "adp_series_country"
-    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id"), primary_key=True)
+    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id", ondelete="CASCADE"), primary_key=True)
     adp_country_country_code = Column(String(3), ForeignKey("adp_country.country_code"), primary_key=True)
     
     series = relationship("ADPSeries", back_populates="available_countries")
     country = relationship("ADPCountry")
 
+    __table_args__ = (
+        Index('ix_adp_series_country_country', 'adp_country_country_code'),
+    )
+
 
 class ADPEpisode(Base):
     __tablename__ = "adp_episode"
-    episode_id = Column(BigInteger, primary_key=True)
-    episode_number = Column(Integer, nullable=False)
+    episode_id = _id_column()
+    episode_number = Column(SmallInteger, nullable=False)
     title = Column(String(160))
-    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id"), nullable=False)
-    synopsis = Column(Text)
+    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id", ondelete="CASCADE"), nullable=False)
+    synopsis = deferred(Column(Text), raiseload=True)
     runtime_minutes = Column(Integer)
     
-    series = relationship("ADPSeries", back_populates="episodes")
-    schedules = relationship("ADPSchedule", back_populates="episode")
+    series = relationship("ADPSeries", back_populates="episodes", lazy="raise")
+    schedules = relationship("ADPSchedule", back_populates="episode", passive_deletes=True, lazy="raise")
     
     __table_args__ = (
         UniqueConstraint('adp_series_series_id', 'episode_number', name='uk_adp_episode_num_per_ser'),
@@ -184,27 +231,40 @@ class ADPEpisode(Base):
 
 class ADPSeriesGenre(Base):
     __tablename__ = "adp_series_genre"
-    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id"), primary_key=True)
+    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id", ondelete="CASCADE"), primary_key=True)
     adp_series_type_type_code = Column(String(16), ForeignKey("adp_series_type.type_code"), primary_key=True)
     series = relationship("ADPSeries", back_populates="genres")
     type = relationship("ADPSeriesType")
 
+    # Genre filter on the series listing looks rows up by type code
+    __table_args__ = (
+        Index('ix_adp_series_genre_type', 'adp_series_type_type_code'),
+    )
+
 
 class ADPSeriesDub(Base):
     __tablename__ = "adp_series_dub"
-    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id"), primary_key=True)
+    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id", ondelete="CASCADE"), primary_key=True)
     adp_language_language_code = Column(String(8), ForeignKey("adp_language.language_code"), primary_key=True)
     series = relationship("ADPSeries", back_populates="dubs")
     language = relationship("ADPLanguage")
 
+    __table_args__ = (
+        Index('ix_adp_series_dub_language', 'adp_language_language_code'),
+    )
+
 
 class ADPSeriesSub(Base):
     __tablename__ = "adp_series_sub"
-    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id"), primary_key=True)
+    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id", ondelete="CASCADE"), primary_key=True)
     adp_language_language_code = Column(String(8), ForeignKey("adp_language.language_code"), primary_key=True)
     series = relationship("ADPSeries", back_populates="subs")
     language = relationship("ADPLanguage")
 
+    __table_args__ = (
+        Index('ix_adp_series_sub_language', 'adp_language_language_code'),
+    )
+
 
 # ============================================
 # CONTRACT (Phase 1)
@@ -212,7 +272,7 @@ class ADPSeriesSub(Base):
 
 class ADPContract(Base):
     __tablename__ = "adp_contract"
-    contract_id = Column(BigInteger, primary_key=True)
+    contract_id = _id_column()
     contract_start_date = Column(Date, nullable=False)
     contract_end_date = Column(Date)
     per_episode_charge = Column(Numeric(12,2))
@@ -225,6 +285,20 @@ class ADPContract(Base):
     production_house = relationship("ADPProductionHouse", back_populates="contracts")
     renewed_from = relationship("ADPContract", remote_side=[contract_id])
 
+    __table_args__ = (
+        Index('ix_adp_contract_series', 'adp_series_series_id'),
+        Index('ix_adp_contract_house', 'adp_production_house_house_id'),
+        # Only active contracts are counted/filtered on; keep just those rows
+        Index(
+            'ix_adp_contract_active', 'adp_series_series_id',
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
+        CheckConstraint(
+            "status IN ('ACTIVE', 'COMPLETED', 'TERMINATED', 'EXPIRED', 'SUSPENDED')",
+            name='ck_adp_contract_status',
+        ),
+    )
+
 
 # ============================================
 # SCHEDULE (Phase 1)
@@ -232,15 +306,19 @@ class ADPContract(Base):
 
 class ADPSchedule(Base):
     __tablename__ = "adp_schedule"
-    schedule_id = Column(BigInteger, primary_key=True)
+    schedule_id = _id_column()
     start_datetime = Column(DateTime, nullable=False)
     end_datetime = Column(DateTime, nullable=False)
     total_viewers = Column(BigInteger, nullable=False, default=0)
     tech_interrupt_yn = Column(CHAR(1), nullable=False, default='N')  # 'Y' or 'N'
-    adp_episode_episode_id = Column(BigInteger, ForeignKey("adp_episode.episode_id"), nullable=False)
+    adp_episode_episode_id = Column(BigInteger, ForeignKey("adp_episode.episode_id", ondelete="CASCADE"), nullable=False)
     
     episode = relationship("ADPEpisode", back_populates="schedules")
 
+    __table_args__ = (
+        Index('ix_adp_schedule_episode', 'adp_episode_episode_id'),
+    )
+
 
 # ============================================
 # FEEDBACK & WATCHLIST
@@ -249,21 +327,72 @@ class ADPSchedule(Base):
 class ADPFeedback(Base):
     __tablename__ = "adp_feedback"
     adp_account_account_id = Column(BigInteger, ForeignKey("adp_account.account_id"), primary_key=True)
-    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id"), primary_key=True)
+    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id", ondelete="CASCADE"), primary_key=True)
     feedback_text = Column(String(2000))
-    rating = Column(SmallInteger, nullable=False)  # 1-5
+    rating = Column(SmallInteger, nullable=False)
     feedback_date = Column(Date, nullable=False)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     account = relationship("ADPAccount", back_populates="feedbacks")
     series = relationship("ADPSeries", back_populates="feedbacks")
 
+    # The PK leads with the account; per-series reads need their own index
+    __table_args__ = (
+        Index('ix_adp_feedback_series', 'adp_series_series_id'),
+        CheckConstraint('rating BETWEEN 1 AND 5', name='ck_adp_feedback_rating'),
+    )
+
+
+# adp_series.average_rating / rating_count are maintained here, not by the app.
+# Each change re-aggregates only the affected series through
+# ix_adp_feedback_series; running +/- arithmetic would drift because
+# average_rating is stored rounded to two places.
+_FEEDBACK_RATING_FN = DDL("""
+CREATE OR REPLACE FUNCTION adp_refresh_series_rating() RETURNS trigger AS $$
+DECLARE
+    sid BIGINT;
+BEGIN
+    FOREACH sid IN ARRAY ARRAY[
+        CASE WHEN TG_OP <> 'INSERT' THEN OLD.adp_series_series_id END,
+        CASE WHEN TG_OP <> 'DELETE' THEN NEW.adp_series_series_id END
+    ] LOOP
+        CONTINUE WHEN sid IS NULL;
+        UPDATE adp_series s
+           SET rating_count = agg.n,
+               average_rating = COALESCE(agg.avg, 0)
+          FROM (SELECT COUNT(*) AS n, ROUND(AVG(rating), 2) AS avg
+                  FROM adp_feedback
+                 WHERE adp_series_series_id = sid) agg
+         WHERE s.series_id = sid;
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+_FEEDBACK_RATING_TRIGGER = DDL("""
+CREATE TRIGGER trg_adp_feedback_rating
+AFTER INSERT OR DELETE OR UPDATE OF rating, adp_series_series_id ON adp_feedback
+FOR EACH ROW EXECUTE FUNCTION adp_refresh_series_rating()
+""")
+event.listen(
+    ADPFeedback.__table__, "after_create",
+    _FEEDBACK_RATING_FN.execute_if(dialect="postgresql"),
+)
+event.listen(
+    ADPFeedback.__table__, "after_create",
+    _FEEDBACK_RATING_TRIGGER.execute_if(dialect="postgresql"),
+)
+
 
 class ADPWatchlist(Base):
     __tablename__ = "adp_watchlist"
     adp_account_account_id = Column(BigInteger, ForeignKey("adp_account.account_id"), primary_key=True)
-    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id"), primary_key=True)
-    added_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    adp_series_series_id = Column(BigInteger, ForeignKey("adp_series.series_id", ondelete="CASCADE"), primary_key=True)
+    added_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     account = relationship("ADPAccount", back_populates="watchlist_items")
     series = relationship("ADPSeries", back_populates="watchlist_entries")
+
+    __table_args__ = (
+        Index('ix_adp_watchlist_series', 'adp_series_series_id'),
+    )
@@ -1,11 +1,11 @@
 # app/routers/accounts.py
 
 from datetime import date
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import bindparam, exists, select
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from app import models, schemas
 from app.database import get_db
@@ -13,6 +13,11 @@ from app.deps import get_current_user, require_admin, get_current_account
 
 router = APIRouter()
 
+# Built once at import; create_account only binds the user id
+_HAS_ACCOUNT_STMT = select(
+    exists().where(models.ADPAccount.adp_user_user_id == bindparam("uid"))
+)
+
 
 # -------------------------------------------------------------------------
 # GET MY ACCOUNT
@@ -36,21 +41,14 @@ def create_account(
 ):
     """Create an account for the current user."""
     # Check if user already has an account
-    existing = db.query(models.ADPAccount).filter(
-        models.ADPAccount.adp_user_user_id == user.user_id
-    ).first()
-    if existing:
+    has_account = db.execute(_HAS_ACCOUNT_STMT, {"uid": user.user_id}).scalar()
+    if has_account:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User already has an account",
         )
 
-    # Generate account_id
-    max_id = db.query(func.max(models.ADPAccount.account_id)).scalar()
-    next_id = (max_id or 0) + 1
-
     account = models.ADPAccount(
-        account_id=next_id,
         first_name=payload.first_name,
         last_name=payload.last_name,
         address_line1=payload.address_line1,
@@ -79,23 +77,11 @@ def update_my_account(
     account: models.ADPAccount = Depends(get_current_account),
 ):
     """Update the current user's account."""
-    if payload.first_name is not None:
-        account.first_name = payload.first_name
-    if payload.last_name is not None:
-        account.last_name = payload.last_name
-    if payload.address_line1 is not None:
-        account.address_line1 = payload.address_line1
-    if payload.city is not None:
-        account.city = payload.city
-    if payload.state_province is not None:
-        account.state_province = payload.state_province
-    if payload.postal_code is not None:
-        account.postal_code = payload.postal_code
-    if payload.monthly_service_fee is not None:
-        account.monthly_service_fee = payload.monthly_service_fee
-
-    db.commit()
-    db.refresh(account)
+    changes = payload.model_dump(exclude_unset=True, exclude_none=True)
+    if changes:
+        for field, value in changes.items():
+            setattr(account, field, value)
+        db.commit()
     return account
 
 
@@ -105,14 +91,24 @@ def update_my_account(
 
 @router.get("/", response_model=List[schemas.AccountRead])
 def list_accounts(
-    skip: int = 0,
+    after_id: Optional[int] = None,
     limit: int = 100,
     db: Session = Depends(get_db),
     admin: models.ADPUser = Depends(require_admin),
 ):
-    """List all accounts (admin only)."""
-    accounts = db.query(models.ADPAccount).offset(skip).limit(limit).all()
-    return accounts
+    """List all accounts (admin only).
+
+    Keyset-paginated by account_id: pass the last account_id of a page as
+    ``after_id`` to get the next one.
+    """
+    query = (
+        db.query(models.ADPAccount)
+        .options(joinedload(models.ADPAccount.country), raiseload("*"))
+        .order_by(models.ADPAccount.account_id)
+    )
+    if after_id is not None:
+        query = query.filter(models.ADPAccount.account_id > after_id)
+    return query.limit(limit).all()
 
 
 @router.get("/{account_id}", response_model=schemas.AccountRead)
@@ -122,9 +118,10 @@ def get_account(
     admin: models.ADPUser = Depends(require_admin),
 ):
     """Get a specific account (admin only)."""
-    account = db.query(models.ADPAccount).filter(
-        models.ADPAccount.account_id == account_id
-    ).first()
+    account = db.get(
+        models.ADPAccount, account_id,
+        options=[joinedload(models.ADPAccount.country)],
+    )
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     return account
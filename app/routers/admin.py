@@ -6,17 +6,22 @@ Admin Router - Full CRUD for all Phase 1 entities
 - Schedules
 - Episodes
 """
+import threading
+from contextlib import contextmanager
 from datetime import datetime, date
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Literal, Optional
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from pydantic import BaseModel
+from sqlalchemy import bindparam, case, delete, func, insert, select, text, update
+from sqlalchemy.exc import IntegrityError
+from pydantic import BaseModel, Field
 
 from ..deps import get_db, get_current_user, require_admin
 from ..models import (
     ADPUser, ADPProductionHouse, ADPProducer, ADPProducerHouse,
-    ADPContract, ADPSchedule, ADPEpisode, ADPSeries, ADPCountry
+    ADPContract, ADPSchedule, ADPEpisode, ADPSeries, ADPCountry,
+    ADPAccount, ADPFeedback,
 )
 
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -103,11 +108,15 @@ class ProducerHouseCreate(BaseModel):
     role_desc: Optional[str] = None
 
 # Contract
+# Checked on write only: status is a varchar and older rows may hold other
+# values, so ContractResponse.status stays a plain str.
+ContractStatus = Literal["ACTIVE", "COMPLETED", "TERMINATED", "EXPIRED", "SUSPENDED"]
+
 class ContractCreate(BaseModel):
     contract_start_date: date
     contract_end_date: date
     per_episode_charge: float
-    status: str = "ACTIVE"
+    status: ContractStatus = "ACTIVE"
     series_id: int
     house_id: int
     renewed_from_id: Optional[int] = None
@@ -116,7 +125,7 @@ class ContractUpdate(BaseModel):
     contract_start_date: Optional[date] = None
     contract_end_date: Optional[date] = None
     per_episode_charge: Optional[float] = None
-    status: Optional[str] = None
+    status: Optional[ContractStatus] = None
 
 class ContractResponse(BaseModel):
     contract_id: int
@@ -156,14 +165,14 @@ class ScheduleResponse(BaseModel):
 
 # Episode
 class EpisodeCreate(BaseModel):
-    episode_number: int
+    episode_number: int = Field(ge=0, le=32767)  # SMALLINT
     title: str
     series_id: int
     synopsis: Optional[str] = None
     runtime_minutes: Optional[int] = None
 
 class EpisodeUpdate(BaseModel):
-    episode_number: Optional[int] = None
+    episode_number: Optional[int] = Field(default=None, ge=0, le=32767)
     title: Optional[str] = None
     synopsis: Optional[str] = None
     runtime_minutes: Optional[int] = None
@@ -178,44 +187,131 @@ class EpisodeResponse(BaseModel):
     runtime_minutes: Optional[int]
 
 
+# ============================================
+# RESPONSE ROWS
+# ============================================
+
+# Each response's columns, labelled with its field names and joined to the
+# tables its *_name fields come from, so a list is one SELECT of plain rows
+# instead of an ORM object plus a lookup per related name.
+_HOUSE_ROWS = select(
+    ADPProductionHouse.house_id,
+    ADPProductionHouse.name,
+    ADPProductionHouse.address_line1,
+    ADPProductionHouse.city,
+    ADPProductionHouse.state_province,
+    ADPProductionHouse.postal_code,
+    ADPProductionHouse.year_established,
+    ADPProductionHouse.adp_country_country_code.label("country_code"),
+    ADPCountry.country_name,
+).outerjoin(ADPCountry, ADPCountry.country_code == ADPProductionHouse.adp_country_country_code)
+
+_PRODUCER_ROWS = select(
+    ADPProducer.producer_id,
+    ADPProducer.first_name,
+    ADPProducer.last_name,
+    ADPProducer.email,
+    ADPProducer.phone,
+    ADPProducer.address_line1,
+    ADPProducer.city,
+    ADPProducer.state_province,
+    ADPProducer.postal_code,
+    ADPProducer.adp_country_country_code.label("country_code"),
+    ADPCountry.country_name,
+).outerjoin(ADPCountry, ADPCountry.country_code == ADPProducer.adp_country_country_code)
+
+_CONTRACT_ROWS = select(
+    ADPContract.contract_id,
+    ADPContract.contract_start_date,
+    ADPContract.contract_end_date,
+    ADPContract.per_episode_charge,
+    ADPContract.status,
+    ADPContract.adp_series_series_id.label("series_id"),
+    ADPSeries.name.label("series_name"),
+    ADPContract.adp_production_house_house_id.label("house_id"),
+    ADPProductionHouse.name.label("house_name"),
+    ADPContract.renewed_from_id,
+).outerjoin(
+    ADPSeries, ADPSeries.series_id == ADPContract.adp_series_series_id
+).outerjoin(
+    ADPProductionHouse, ADPProductionHouse.house_id == ADPContract.adp_production_house_house_id
+)
+
+_SCHEDULE_ROWS = select(
+    ADPSchedule.schedule_id,
+    ADPSchedule.start_datetime,
+    ADPSchedule.end_datetime,
+    ADPSchedule.total_viewers,
+    ADPSchedule.tech_interrupt_yn,
+    ADPSchedule.adp_episode_episode_id.label("episode_id"),
+    ADPEpisode.title.label("episode_title"),
+    ADPSeries.name.label("series_name"),
+).outerjoin(
+    ADPEpisode, ADPEpisode.episode_id == ADPSchedule.adp_episode_episode_id
+).outerjoin(
+    ADPSeries, ADPSeries.series_id == ADPEpisode.adp_series_series_id
+)
+
+_EPISODE_ROWS = select(
+    ADPEpisode.episode_id,
+    ADPEpisode.episode_number,
+    ADPEpisode.title,
+    ADPEpisode.adp_series_series_id.label("series_id"),
+    ADPSeries.name.label("series_name"),
+    ADPEpisode.synopsis,
+    ADPEpisode.runtime_minutes,
+).outerjoin(ADPSeries, ADPSeries.series_id == ADPEpisode.adp_series_series_id)
+
+
+def _changed_columns(data: BaseModel) -> dict:
+    """Column values for the fields a PUT body actually sets.
+
+    Fields left out or sent as null are skipped, as the handlers always did;
+    country_code is renamed to the model's FK column.
+    """
+    changes = data.model_dump(exclude_unset=True, exclude_none=True)
+    if "country_code" in changes:
+        changes["adp_country_country_code"] = changes.pop("country_code")
+    return changes
+
+
+@contextmanager
+def _unique_violation(db: Session, constraint: str, detail: str):
+    """Turn a violation of the named unique constraint into a 400.
+
+    Uniqueness is left to the database instead of a SELECT beforehand, which
+    costs a round trip and still races with concurrent writers. Drivers that
+    don't report the constraint name (SQLite in dev) get the 400 as well.
+    """
+    try:
+        yield
+    except IntegrityError as e:
+        db.rollback()
+        diag = getattr(e.orig, "diag", None)
+        if diag is not None and diag.constraint_name != constraint:
+            raise
+        raise HTTPException(status_code=400, detail=detail)
+
+
 # ============================================
 # PRODUCTION HOUSE CRUD
 # ============================================
 
 @router.get("/production-houses", response_model=List[ProductionHouseResponse])
-async def list_production_houses(
+def list_production_houses(
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    houses = db.query(ADPProductionHouse).order_by(ADPProductionHouse.name).all()
-    result = []
-    for h in houses:
-        country = db.query(ADPCountry).filter(ADPCountry.country_code == h.adp_country_country_code).first()
-        result.append(ProductionHouseResponse(
-            house_id=h.house_id,
-            name=h.name,
-            address_line1=h.address_line1,
-            city=h.city,
-            state_province=h.state_province,
-            postal_code=h.postal_code,
-            year_established=h.year_established,
-            country_code=h.adp_country_country_code,
-            country_name=country.country_name if country else None
-        ))
-    return result
+    return db.execute(_HOUSE_ROWS.order_by(ADPProductionHouse.name)).mappings().all()
 
 
 @router.post("/production-houses", response_model=ProductionHouseResponse)
-async def create_production_house(
+def create_production_house(
     data: ProductionHouseCreate,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    # Get next ID
-    max_id = db.query(func.max(ADPProductionHouse.house_id)).scalar() or 0
-    
     house = ADPProductionHouse(
-        house_id=max_id + 1,
         name=data.name,
         address_line1=data.address_line1,
         city=data.city,
@@ -226,81 +322,56 @@ async def create_production_house(
     )
     db.add(house)
     db.commit()
-    db.refresh(house)
     
-    country = db.query(ADPCountry).filter(ADPCountry.country_code == house.adp_country_country_code).first()
-    return ProductionHouseResponse(
-        house_id=house.house_id,
-        name=house.name,
-        address_line1=house.address_line1,
-        city=house.city,
-        state_province=house.state_province,
-        postal_code=house.postal_code,
-        year_established=house.year_established,
-        country_code=house.adp_country_country_code,
-        country_name=country.country_name if country else None
-    )
+    # The INSERT returned house_id; read the response row with its country
+    return db.execute(
+        _HOUSE_ROWS.where(ADPProductionHouse.house_id == house.house_id)
+    ).mappings().one()
 
 
 @router.put("/production-houses/{house_id}", response_model=ProductionHouseResponse)
-async def update_production_house(
+def update_production_house(
     house_id: int,
     data: ProductionHouseUpdate,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    house = db.query(ADPProductionHouse).filter(ADPProductionHouse.house_id == house_id).first()
-    if not house:
+    changes = _changed_columns(data)
+    if changes:
+        db.execute(
+            update(ADPProductionHouse)
+            .where(ADPProductionHouse.house_id == house_id)
+            .values(**changes)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    
+    row = db.execute(
+        _HOUSE_ROWS.where(ADPProductionHouse.house_id == house_id)
+    ).mappings().first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Production house not found")
-    
-    if data.name is not None:
-        house.name = data.name
-    if data.address_line1 is not None:
-        house.address_line1 = data.address_line1
-    if data.city is not None:
-        house.city = data.city
-    if data.state_province is not None:
-        house.state_province = data.state_province
-    if data.postal_code is not None:
-        house.postal_code = data.postal_code
-    if data.year_established is not None:
-        house.year_established = data.year_established
-    if data.country_code is not None:
-        house.adp_country_country_code = data.country_code
-    
-    db.commit()
-    db.refresh(house)
-    
-    country = db.query(ADPCountry).filter(ADPCountry.country_code == house.adp_country_country_code).first()
-    return ProductionHouseResponse(
-        house_id=house.house_id,
-        name=house.name,
-        address_line1=house.address_line1,
-        city=house.city,
-        state_province=house.state_province,
-        postal_code=house.postal_code,
-        year_established=house.year_established,
-        country_code=house.adp_country_country_code,
-        country_name=country.country_name if country else None
-    )
+    return row
 
 
 @router.delete("/production-houses/{house_id}")
-async def delete_production_house(
+def delete_production_house(
     house_id: int,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    house = db.query(ADPProductionHouse).filter(ADPProductionHouse.house_id == house_id).first()
-    if not house:
-        raise HTTPException(status_code=404, detail="Production house not found")
-    
     # Check for contracts
     contracts = db.query(ADPContract).filter(ADPContract.adp_production_house_house_id == house_id).count()
     if contracts > 0:
         raise HTTPException(status_code=400, detail="Cannot delete: has associated contracts")
     
-    db.delete(house)
+    deleted = db.execute(
+        delete(ADPProductionHouse)
+        .where(ADPProductionHouse.house_id == house_id)
+        .returning(ADPProductionHouse.house_id)
+    ).scalar()
+    if deleted is None:
+        raise HTTPException(status_code=404, detail="Production house not found")
     db.commit()
     return {"message": "Production house deleted"}
 
@@ -310,45 +381,22 @@ async def delete_production_house(
 # ============================================
 
 @router.get("/producers", response_model=List[ProducerResponse])
-async def list_producers(
+def list_producers(
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    producers = db.query(ADPProducer).order_by(ADPProducer.last_name, ADPProducer.first_name).all()
-    result = []
-    for p in producers:
-        country = db.query(ADPCountry).filter(ADPCountry.country_code == p.adp_country_country_code).first()
-        result.append(ProducerResponse(
-            producer_id=p.producer_id,
-            first_name=p.first_name,
-            last_name=p.last_name,
-            email=p.email,
-            phone=p.phone,
-            address_line1=p.address_line1,
-            city=p.city,
-            state_province=p.state_province,
-            postal_code=p.postal_code,
-            country_code=p.adp_country_country_code,
-            country_name=country.country_name if country else None
-        ))
-    return result
+    return db.execute(
+        _PRODUCER_ROWS.order_by(ADPProducer.last_name, ADPProducer.first_name)
+    ).mappings().all()
 
 
 @router.post("/producers", response_model=ProducerResponse)
-async def create_producer(
+def create_producer(
     data: ProducerCreate,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    # Check email unique
-    existing = db.query(ADPProducer).filter(ADPProducer.email == data.email).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already exists")
-    
-    max_id = db.query(func.max(ADPProducer.producer_id)).scalar() or 0
-    
     producer = ADPProducer(
-        producer_id=max_id + 1,
         first_name=data.first_name,
         last_name=data.last_name,
         email=data.email,
@@ -360,97 +408,66 @@ async def create_producer(
         adp_country_country_code=data.country_code
     )
     db.add(producer)
-    db.commit()
-    db.refresh(producer)
+    with _unique_violation(db, "uk_adp_producer_email", "Email already exists"):
+        db.commit()
     
-    country = db.query(ADPCountry).filter(ADPCountry.country_code == producer.adp_country_country_code).first()
-    return ProducerResponse(
-        producer_id=producer.producer_id,
-        first_name=producer.first_name,
-        last_name=producer.last_name,
-        email=producer.email,
-        phone=producer.phone,
-        address_line1=producer.address_line1,
-        city=producer.city,
-        state_province=producer.state_province,
-        postal_code=producer.postal_code,
-        country_code=producer.adp_country_country_code,
-        country_name=country.country_name if country else None
-    )
+    return db.execute(
+        _PRODUCER_ROWS.where(ADPProducer.producer_id == producer.producer_id)
+    ).mappings().one()
 
 
 @router.put("/producers/{producer_id}", response_model=ProducerResponse)
-async def update_producer(
+def update_producer(
     producer_id: int,
     data: ProducerUpdate,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    producer = db.query(ADPProducer).filter(ADPProducer.producer_id == producer_id).first()
-    if not producer:
+    changes = _changed_columns(data)
+    if changes:
+        with _unique_violation(db, "uk_adp_producer_email", "Email already exists"):
+            db.execute(
+                update(ADPProducer)
+                .where(ADPProducer.producer_id == producer_id)
+                .values(**changes)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+    
+    row = db.execute(
+        _PRODUCER_ROWS.where(ADPProducer.producer_id == producer_id)
+    ).mappings().first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Producer not found")
-    
-    if data.first_name is not None:
-        producer.first_name = data.first_name
-    if data.last_name is not None:
-        producer.last_name = data.last_name
-    if data.email is not None:
-        existing = db.query(ADPProducer).filter(ADPProducer.email == data.email, ADPProducer.producer_id != producer_id).first()
-        if existing:
-            raise HTTPException(status_code=400, detail="Email already exists")
-        producer.email = data.email
-    if data.phone is not None:
-        producer.phone = data.phone
-    if data.address_line1 is not None:
-        producer.address_line1 = data.address_line1
-    if data.city is not None:
-        producer.city = data.city
-    if data.state_province is not None:
-        producer.state_province = data.state_province
-    if data.postal_code is not None:
-        producer.postal_code = data.postal_code
-    if data.country_code is not None:
-        producer.adp_country_country_code = data.country_code
-    
-    db.commit()
-    db.refresh(producer)
-    
-    country = db.query(ADPCountry).filter(ADPCountry.country_code == producer.adp_country_country_code).first()
-    return ProducerResponse(
-        producer_id=producer.producer_id,
-        first_name=producer.first_name,
-        last_name=producer.last_name,
-        email=producer.email,
-        phone=producer.phone,
-        address_line1=producer.address_line1,
-        city=producer.city,
-        state_province=producer.state_province,
-        postal_code=producer.postal_code,
-        country_code=producer.adp_country_country_code,
-        country_name=country.country_name if country else None
-    )
+    return row
 
 
 @router.delete("/producers/{producer_id}")
-async def delete_producer(
+def delete_producer(
     producer_id: int,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    producer = db.query(ADPProducer).filter(ADPProducer.producer_id == producer_id).first()
-    if not producer:
+    # Explicit so databases created without ON DELETE CASCADE behave the same
+    db.execute(
+        delete(ADPProducerHouse)
+        .where(ADPProducerHouse.adp_producer_producer_id == producer_id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted = db.execute(
+        delete(ADPProducer)
+        .where(ADPProducer.producer_id == producer_id)
+        .returning(ADPProducer.producer_id)
+    ).scalar()
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Producer not found")
-    
-    # Delete producer-house associations first
-    db.query(ADPProducerHouse).filter(ADPProducerHouse.adp_producer_producer_id == producer_id).delete()
-    db.delete(producer)
     db.commit()
     return {"message": "Producer deleted"}
 
 
 # Assign producer to house
 @router.post("/producer-house")
-async def assign_producer_to_house(
+def assign_producer_to_house(
     data: ProducerHouseCreate,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
@@ -473,19 +490,22 @@ async def assign_producer_to_house(
 
 
 @router.delete("/producer-house/{producer_id}/{house_id}")
-async def remove_producer_from_house(
+def remove_producer_from_house(
     producer_id: int,
     house_id: int,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    assignment = db.query(ADPProducerHouse).filter(
-        ADPProducerHouse.adp_producer_producer_id == producer_id,
-        ADPProducerHouse.adp_production_house_house_id == house_id
-    ).first()
-    if not assignment:
+    deleted = db.execute(
+        delete(ADPProducerHouse)
+        .where(
+            ADPProducerHouse.adp_producer_producer_id == producer_id,
+            ADPProducerHouse.adp_production_house_house_id == house_id
+        )
+        .returning(ADPProducerHouse.adp_producer_producer_id)
+    ).scalar()
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Assignment not found")
-    db.delete(assignment)
     db.commit()
     return {"message": "Assignment removed"}
 
@@ -495,48 +515,33 @@ async def remove_producer_from_house(
 # ============================================
 
 @router.get("/contracts", response_model=List[ContractResponse])
-async def list_contracts(
+def list_contracts(
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    contracts = db.query(ADPContract).order_by(ADPContract.contract_start_date.desc()).all()
-    result = []
-    for c in contracts:
-        series = db.query(ADPSeries).filter(ADPSeries.series_id == c.adp_series_series_id).first()
-        house = db.query(ADPProductionHouse).filter(ADPProductionHouse.house_id == c.adp_production_house_house_id).first()
-        result.append(ContractResponse(
-            contract_id=c.contract_id,
-            contract_start_date=c.contract_start_date,
-            contract_end_date=c.contract_end_date,
-            per_episode_charge=float(c.per_episode_charge),
-            status=c.status,
-            series_id=c.adp_series_series_id,
-            series_name=series.name if series else None,
-            house_id=c.adp_production_house_house_id,
-            house_name=house.name if house else None,
-            renewed_from_id=c.renewed_from_id
-        ))
-    return result
+    return db.execute(
+        _CONTRACT_ROWS.order_by(ADPContract.contract_start_date.desc())
+    ).mappings().all()
 
 
 @router.post("/contracts", response_model=ContractResponse)
-async def create_contract(
+def create_contract(
     data: ContractCreate,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    # Validate series and house exist
-    series = db.query(ADPSeries).filter(ADPSeries.series_id == data.series_id).first()
-    if not series:
+    # Validate series and house exist; both names are NOT NULL, so one
+    # SELECT of the two names doubles as the existence check
+    series_name, house_name = db.execute(select(
+        select(ADPSeries.name).where(ADPSeries.series_id == data.series_id).scalar_subquery(),
+        select(ADPProductionHouse.name).where(ADPProductionHouse.house_id == data.house_id).scalar_subquery(),
+    )).one()
+    if series_name is None:
         raise HTTPException(status_code=404, detail="Series not found")
-    house = db.query(ADPProductionHouse).filter(ADPProductionHouse.house_id == data.house_id).first()
-    if not house:
+    if house_name is None:
         raise HTTPException(status_code=404, detail="Production house not found")
     
-    max_id = db.query(func.max(ADPContract.contract_id)).scalar() or 0
-    
     contract = ADPContract(
-        contract_id=max_id + 1,
         contract_start_date=data.contract_start_date,
         contract_end_date=data.contract_end_date,
         per_episode_charge=data.per_episode_charge,
@@ -547,7 +552,6 @@ async def create_contract(
     )
     db.add(contract)
     db.commit()
-    db.refresh(contract)
     
     return ContractResponse(
         contract_id=contract.contract_id,
@@ -556,63 +560,51 @@ async def create_contract(
         per_episode_charge=float(contract.per_episode_charge),
         status=contract.status,
         series_id=contract.adp_series_series_id,
-        series_name=series.name,
+        series_name=series_name,
         house_id=contract.adp_production_house_house_id,
-        house_name=house.name,
+        house_name=house_name,
         renewed_from_id=contract.renewed_from_id
     )
 
 
 @router.put("/contracts/{contract_id}", response_model=ContractResponse)
-async def update_contract(
+def update_contract(
     contract_id: int,
     data: ContractUpdate,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    contract = db.query(ADPContract).filter(ADPContract.contract_id == contract_id).first()
-    if not contract:
+    changes = _changed_columns(data)
+    if changes:
+        db.execute(
+            update(ADPContract)
+            .where(ADPContract.contract_id == contract_id)
+            .values(**changes)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    
+    row = db.execute(
+        _CONTRACT_ROWS.where(ADPContract.contract_id == contract_id)
+    ).mappings().first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Contract not found")
-    
-    if data.contract_start_date is not None:
-        contract.contract_start_date = data.contract_start_date
-    if data.contract_end_date is not None:
-        contract.contract_end_date = data.contract_end_date
-    if data.per_episode_charge is not None:
-        contract.per_episode_charge = data.per_episode_charge
-    if data.status is not None:
-        contract.status = data.status
-    
-    db.commit()
-    db.refresh(contract)
-    
-    series = db.query(ADPSeries).filter(ADPSeries.series_id == contract.adp_series_series_id).first()
-    house = db.query(ADPProductionHouse).filter(ADPProductionHouse.house_id == contract.adp_production_house_house_id).first()
-    
-    return ContractResponse(
-        contract_id=contract.contract_id,
-        contract_start_date=contract.contract_start_date,
-        contract_end_date=contract.contract_end_date,
-        per_episode_charge=float(contract.per_episode_charge),
-        status=contract.status,
-        series_id=contract.adp_series_series_id,
-        series_name=series.name if series else None,
-        house_id=contract.adp_production_house_house_id,
-        house_name=house.name if house else None,
-        renewed_from_id=contract.renewed_from_id
-    )
+    return row
 
 
 @router.delete("/contracts/{contract_id}")
-async def delete_contract(
+def delete_contract(
     contract_id: int,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    contract = db.query(ADPContract).filter(ADPContract.contract_id == contract_id).first()
-    if not contract:
+    deleted = db.execute(
+        delete(ADPContract)
+        .where(ADPContract.contract_id == contract_id)
+        .returning(ADPContract.contract_id)
+    ).scalar()
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Contract not found")
-    db.delete(contract)
     db.commit()
     return {"message": "Contract deleted"}
 
@@ -622,33 +614,17 @@ async def delete_contract(
 # ============================================
 
 @router.get("/schedules", response_model=List[ScheduleResponse])
-async def list_schedules(
+def list_schedules(
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    schedules = db.query(ADPSchedule).order_by(ADPSchedule.start_datetime.desc()).all()
-    result = []
-    for s in schedules:
-        episode = db.query(ADPEpisode).filter(ADPEpisode.episode_id == s.adp_episode_episode_id).first()
-        series_name = None
-        if episode:
-            series = db.query(ADPSeries).filter(ADPSeries.series_id == episode.adp_series_series_id).first()
-            series_name = series.name if series else None
-        result.append(ScheduleResponse(
-            schedule_id=s.schedule_id,
-            start_datetime=s.start_datetime,
-            end_datetime=s.end_datetime,
-            total_viewers=s.total_viewers,
-            tech_interrupt_yn=s.tech_interrupt_yn,
-            episode_id=s.adp_episode_episode_id,
-            episode_title=episode.title if episode else None,
-            series_name=series_name
-        ))
-    return result
+    return db.execute(
+        _SCHEDULE_ROWS.order_by(ADPSchedule.start_datetime.desc())
+    ).mappings().all()
 
 
 @router.post("/schedules", response_model=ScheduleResponse)
-async def create_schedule(
+def create_schedule(
     data: ScheduleCreate,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
@@ -662,10 +638,7 @@ async def create_schedule(
     if data.end_datetime <= data.start_datetime:
         raise HTTPException(status_code=400, detail="End time must be after start time")
     
-    max_id = db.query(func.max(ADPSchedule.schedule_id)).scalar() or 0
-    
     schedule = ADPSchedule(
-        schedule_id=max_id + 1,
         start_datetime=data.start_datetime,
         end_datetime=data.end_datetime,
         total_viewers=data.total_viewers,
@@ -674,73 +647,52 @@ async def create_schedule(
     )
     db.add(schedule)
     db.commit()
-    db.refresh(schedule)
-    
-    series = db.query(ADPSeries).filter(ADPSeries.series_id == episode.adp_series_series_id).first()
     
-    return ScheduleResponse(
-        schedule_id=schedule.schedule_id,
-        start_datetime=schedule.start_datetime,
-        end_datetime=schedule.end_datetime,
-        total_viewers=schedule.total_viewers,
-        tech_interrupt_yn=schedule.tech_interrupt_yn,
-        episode_id=schedule.adp_episode_episode_id,
-        episode_title=episode.title,
-        series_name=series.name if series else None
-    )
+    return db.execute(
+        _SCHEDULE_ROWS.where(ADPSchedule.schedule_id == schedule.schedule_id)
+    ).mappings().one()
 
 
 @router.put("/schedules/{schedule_id}", response_model=ScheduleResponse)
-async def update_schedule(
+def update_schedule(
     schedule_id: int,
     data: ScheduleUpdate,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    schedule = db.query(ADPSchedule).filter(ADPSchedule.schedule_id == schedule_id).first()
-    if not schedule:
+    changes = _changed_columns(data)
+    if "tech_interrupt_yn" in changes:
+        changes["tech_interrupt_yn"] = changes["tech_interrupt_yn"].upper()
+    if changes:
+        db.execute(
+            update(ADPSchedule)
+            .where(ADPSchedule.schedule_id == schedule_id)
+            .values(**changes)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    
+    row = db.execute(
+        _SCHEDULE_ROWS.where(ADPSchedule.schedule_id == schedule_id)
+    ).mappings().first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    
-    if data.start_datetime is not None:
-        schedule.start_datetime = data.start_datetime
-    if data.end_datetime is not None:
-        schedule.end_datetime = data.end_datetime
-    if data.total_viewers is not None:
-        schedule.total_viewers = data.total_viewers
-    if data.tech_interrupt_yn is not None:
-        schedule.tech_interrupt_yn = data.tech_interrupt_yn.upper()
-    
-    db.commit()
-    db.refresh(schedule)
-    
-    episode = db.query(ADPEpisode).filter(ADPEpisode.episode_id == schedule.adp_episode_episode_id).first()
-    series_name = None
-    if episode:
-        series = db.query(ADPSeries).filter(ADPSeries.series_id == episode.adp_series_series_id).first()
-        series_name = series.name if series else None
-    
-    return ScheduleResponse(
-        schedule_id=schedule.schedule_id,
-        start_datetime=schedule.start_datetime,
-        end_datetime=schedule.end_datetime,
-        total_viewers=schedule.total_viewers,
-        tech_interrupt_yn=schedule.tech_interrupt_yn,
-        episode_id=schedule.adp_episode_episode_id,
-        episode_title=episode.title if episode else None,
-        series_name=series_name
-    )
+    return row
 
 
 @router.delete("/schedules/{schedule_id}")
-async def delete_schedule(
+def delete_schedule(
     schedule_id: int,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    schedule = db.query(ADPSchedule).filter(ADPSchedule.schedule_id == schedule_id).first()
-    if not schedule:
+    deleted = db.execute(
+        delete(ADPSchedule)
+        .where(ADPSchedule.schedule_id == schedule_id)
+        .returning(ADPSchedule.schedule_id)
+    ).scalar()
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    db.delete(schedule)
     db.commit()
     return {"message": "Schedule deleted"}
 
@@ -750,33 +702,21 @@ async def delete_schedule(
 # ============================================
 
 @router.get("/episodes", response_model=List[EpisodeResponse])
-async def list_episodes(
+def list_episodes(
     series_id: Optional[int] = None,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    query = db.query(ADPEpisode)
+    query = _EPISODE_ROWS
     if series_id:
-        query = query.filter(ADPEpisode.adp_series_series_id == series_id)
-    episodes = query.order_by(ADPEpisode.adp_series_series_id, ADPEpisode.episode_number).all()
-    
-    result = []
-    for e in episodes:
-        series = db.query(ADPSeries).filter(ADPSeries.series_id == e.adp_series_series_id).first()
-        result.append(EpisodeResponse(
-            episode_id=e.episode_id,
-            episode_number=e.episode_number,
-            title=e.title,
-            series_id=e.adp_series_series_id,
-            series_name=series.name if series else None,
-            synopsis=e.synopsis,
-            runtime_minutes=e.runtime_minutes
-        ))
-    return result
+        query = query.where(ADPEpisode.adp_series_series_id == series_id)
+    return db.execute(
+        query.order_by(ADPEpisode.adp_series_series_id, ADPEpisode.episode_number)
+    ).mappings().all()
 
 
 @router.post("/episodes", response_model=EpisodeResponse)
-async def create_episode(
+def create_episode(
     data: EpisodeCreate,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
@@ -785,18 +725,7 @@ async def create_episode(
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
     
-    # Check unique episode number
-    existing = db.query(ADPEpisode).filter(
-        ADPEpisode.adp_series_series_id == data.series_id,
-        ADPEpisode.episode_number == data.episode_number
-    ).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Episode number already exists for this series")
-    
-    max_id = db.query(func.max(ADPEpisode.episode_id)).scalar() or 0
-    
     episode = ADPEpisode(
-        episode_id=max_id + 1,
         episode_number=data.episode_number,
         title=data.title,
         adp_series_series_id=data.series_id,
@@ -806,10 +735,10 @@ async def create_episode(
     db.add(episode)
     
     # Update series episode count
-    series.num_episodes = db.query(ADPEpisode).filter(ADPEpisode.adp_series_series_id == data.series_id).count() + 1
+    series.num_episodes = ADPSeries.num_episodes + 1
     
-    db.commit()
-    db.refresh(episode)
+    with _unique_violation(db, "uk_adp_episode_num_per_ser", "Episode number already exists for this series"):
+        db.commit()
     
     return EpisodeResponse(
         episode_id=episode.episode_id,
@@ -822,70 +751,186 @@ async def create_episode(
     )
 
 
+@router.post("/episodes/bulk", response_model=List[EpisodeResponse])
+def create_episodes_bulk(
+    data: List[EpisodeCreate],
+    db: Session = Depends(get_db),
+    user: ADPUser = Depends(require_admin)
+):
+    if not data:
+        return []
+    
+    series_ids = {e.series_id for e in data}
+    series_names = dict(db.execute(
+        select(ADPSeries.series_id, ADPSeries.name).where(ADPSeries.series_id.in_(series_ids))
+    ).all())
+    missing = series_ids - series_names.keys()
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Series not found: {sorted(missing)}")
+    
+    # One executemany each; on psycopg2 the engine turns the INSERT into
+    # multi-row VALUES pages and the UPDATE into execute_batch pages.
+    try:
+        episode_ids = db.scalars(
+            insert(ADPEpisode).returning(ADPEpisode.episode_id, sort_by_parameter_order=True),
+            [
+                {
+                    "episode_number": e.episode_number,
+                    "title": e.title,
+                    "adp_series_series_id": e.series_id,
+                    "synopsis": e.synopsis,
+                    "runtime_minutes": e.runtime_minutes,
+                }
+                for e in data
+            ],
+        ).all()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Episode number already exists for this series")
+    
+    added = {}
+    for e in data:
+        added[e.series_id] = added.get(e.series_id, 0) + 1
+    series_table = ADPSeries.__table__
+    db.execute(
+        update(series_table)
+        .where(series_table.c.series_id == bindparam("sid"))
+        .values(num_episodes=series_table.c.num_episodes + bindparam("added")),
+        [{"sid": sid, "added": n} for sid, n in added.items()],
+    )
+    db.commit()
+    
+    return [
+        EpisodeResponse(
+            episode_id=episode_id,
+            episode_number=e.episode_number,
+            title=e.title,
+            series_id=e.series_id,
+            series_name=series_names[e.series_id],
+            synopsis=e.synopsis,
+            runtime_minutes=e.runtime_minutes
+        )
+        for episode_id, e in zip(episode_ids, data)
+    ]
+
+
+# CSV bulk import: rows are COPYed into a temp table, then moved into
+# adp_episode with one INSERT ... SELECT so the unique/FK checks and the
+# num_episodes bump still happen server-side in the same transaction.
+_EPISODE_STAGE_DDL = """
+CREATE TEMP TABLE tmp_episode_import (
+    episode_number SMALLINT NOT NULL,
+    title VARCHAR(160),
+    series_id BIGINT NOT NULL,
+    synopsis TEXT,
+    runtime_minutes INTEGER
+) ON COMMIT DROP
+"""
+_EPISODE_STAGE_COPY = (
+    "COPY tmp_episode_import (episode_number, title, series_id, synopsis, runtime_minutes) "
+    "FROM STDIN WITH (FORMAT csv, HEADER true)"
+)
+_EPISODE_STAGE_INSERT = text("""
+INSERT INTO adp_episode (episode_number, title, adp_series_series_id, synopsis, runtime_minutes)
+SELECT episode_number, title, series_id, synopsis, runtime_minutes FROM tmp_episode_import
+""")
+_EPISODE_STAGE_COUNTS = text("""
+UPDATE adp_series s
+   SET num_episodes = s.num_episodes + t.n,
+       updated_at = now()
+  FROM (SELECT series_id, COUNT(*) AS n FROM tmp_episode_import GROUP BY series_id) t
+ WHERE s.series_id = t.series_id
+""")
+
+
+@router.post("/episodes/bulk-copy")
+def import_episodes_csv(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    user: ADPUser = Depends(require_admin)
+):
+    """Import episodes from a CSV with the header
+    episode_number,title,series_id,synopsis,runtime_minutes (PostgreSQL only)."""
+    if db.get_bind().dialect.name != "postgresql":
+        raise HTTPException(status_code=501, detail="CSV import requires PostgreSQL")
+    
+    # COPY goes through the raw psycopg2 cursor on the session's connection
+    dbapi = db.get_bind().dialect.dbapi
+    raw = db.connection().connection
+    try:
+        with raw.cursor() as cur:
+            cur.execute(_EPISODE_STAGE_DDL)
+            cur.copy_expert(_EPISODE_STAGE_COPY, file.file)
+    except (dbapi.DataError, dbapi.IntegrityError) as e:
+        # Bad values, or empty required fields hitting NOT NULL
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Invalid CSV: {e}")
+    
+    try:
+        inserted = db.execute(_EPISODE_STAGE_INSERT).rowcount
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail="Unknown series or episode number already exists for a series",
+        )
+    db.execute(_EPISODE_STAGE_COUNTS)
+    db.commit()
+    return {"message": f"Imported {inserted} episodes", "inserted": inserted}
+
+
 @router.put("/episodes/{episode_id}", response_model=EpisodeResponse)
-async def update_episode(
+def update_episode(
     episode_id: int,
     data: EpisodeUpdate,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    episode = db.query(ADPEpisode).filter(ADPEpisode.episode_id == episode_id).first()
-    if not episode:
+    changes = _changed_columns(data)
+    if changes:
+        with _unique_violation(db, "uk_adp_episode_num_per_ser", "Episode number already exists"):
+            db.execute(
+                update(ADPEpisode)
+                .where(ADPEpisode.episode_id == episode_id)
+                .values(**changes)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+    
+    row = db.execute(
+        _EPISODE_ROWS.where(ADPEpisode.episode_id == episode_id)
+    ).mappings().first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Episode not found")
-    
-    if data.episode_number is not None:
-        # Check unique
-        existing = db.query(ADPEpisode).filter(
-            ADPEpisode.adp_series_series_id == episode.adp_series_series_id,
-            ADPEpisode.episode_number == data.episode_number,
-            ADPEpisode.episode_id != episode_id
-        ).first()
-        if existing:
-            raise HTTPException(status_code=400, detail="Episode number already exists")
-        episode.episode_number = data.episode_number
-    if data.title is not None:
-        episode.title = data.title
-    if data.synopsis is not None:
-        episode.synopsis = data.synopsis
-    if data.runtime_minutes is not None:
-        episode.runtime_minutes = data.runtime_minutes
-    
-    db.commit()
-    db.refresh(episode)
-    
-    series = db.query(ADPSeries).filter(ADPSeries.series_id == episode.adp_series_series_id).first()
-    
-    return EpisodeResponse(
-        episode_id=episode.episode_id,
-        episode_number=episode.episode_number,
-        title=episode.title,
-        series_id=episode.adp_series_series_id,
-        series_name=series.name if series else None,
-        synopsis=episode.synopsis,
-        runtime_minutes=episode.runtime_minutes
-    )
+    return row
 
 
 @router.delete("/episodes/{episode_id}")
-async def delete_episode(
+def delete_episode(
     episode_id: int,
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    episode = db.query(ADPEpisode).filter(ADPEpisode.episode_id == episode_id).first()
-    if not episode:
+    # Explicit so databases created without ON DELETE CASCADE behave the same
+    db.query(ADPSchedule).filter(
+        ADPSchedule.adp_episode_episode_id == episode_id
+    ).delete(synchronize_session=False)
+    series_id = db.execute(
+        delete(ADPEpisode)
+        .where(ADPEpisode.episode_id == episode_id)
+        .returning(ADPEpisode.adp_series_series_id)
+    ).scalar()
+    if series_id is None:
         raise HTTPException(status_code=404, detail="Episode not found")
     
-    series_id = episode.adp_series_series_id
-    
-    # Delete related schedules first
-    db.query(ADPSchedule).filter(ADPSchedule.adp_episode_episode_id == episode_id).delete()
-    db.delete(episode)
-    
-    # Update series episode count
-    series = db.query(ADPSeries).filter(ADPSeries.series_id == series_id).first()
-    if series:
-        series.num_episodes = db.query(ADPEpisode).filter(ADPEpisode.adp_series_series_id == series_id).count()
+    db.execute(
+        update(ADPSeries)
+        .where(ADPSeries.series_id == series_id)
+        .values(num_episodes=case(
+            (ADPSeries.num_episodes > 0, ADPSeries.num_episodes - 1), else_=0
+        ))
+        .execution_options(synchronize_session=False)
+    )
     
     db.commit()
     return {"message": "Episode deleted"}
@@ -895,21 +940,38 @@ async def delete_episode(
 # DASHBOARD STATS
 # ============================================
 
+def _count(model, *criteria):
+    return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+
+# All dashboard counters as scalar subqueries of one SELECT: one round trip
+_STATS_STMT = select(
+    _count(ADPSeries).label("total_series"),
+    _count(ADPEpisode).label("total_episodes"),
+    _count(ADPAccount).label("total_accounts"),
+    _count(ADPFeedback).label("total_feedbacks"),
+    _count(ADPProductionHouse).label("total_production_houses"),
+    _count(ADPProducer).label("total_producers"),
+    _count(ADPContract).label("total_contracts"),
+    _count(ADPSchedule).label("total_schedules"),
+    _count(ADPContract, ADPContract.status == "ACTIVE").label("active_contracts"),
+)
+
+# Dashboard counters tolerate a few seconds of staleness; repeat hits within
+# the TTL are served from memory instead of scanning nine tables.
+_STATS_CACHE: TTLCache = TTLCache(maxsize=1, ttl=15)
+_STATS_CACHE_LOCK = threading.Lock()
+
+
 @router.get("/stats")
-async def get_admin_stats(
+def get_admin_stats(
     db: Session = Depends(get_db),
     user: ADPUser = Depends(require_admin)
 ):
-    from ..models import ADPAccount, ADPFeedback
-    
-    return {
-        "total_series": db.query(ADPSeries).count(),
-        "total_episodes": db.query(ADPEpisode).count(),
-        "total_accounts": db.query(ADPAccount).count(),
-        "total_feedbacks": db.query(ADPFeedback).count(),
-        "total_production_houses": db.query(ADPProductionHouse).count(),
-        "total_producers": db.query(ADPProducer).count(),
-        "total_contracts": db.query(ADPContract).count(),
-        "total_schedules": db.query(ADPSchedule).count(),
-        "active_contracts": db.query(ADPContract).filter(ADPContract.status == "ACTIVE").count(),
-    }
+    with _STATS_CACHE_LOCK:
+        stats = _STATS_CACHE.get("stats")
+    if stats is None:
+        stats = dict(db.execute(_STATS_STMT).one()._mapping)
+        with _STATS_CACHE_LOCK:
+            _STATS_CACHE["stats"] = stats
+    return dict(stats)
@@ -1,55 +1,65 @@
 from datetime import date
 from decimal import Decimal
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy import func
+from sqlalchemy import bindparam, exists, func, select
 from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..models import ADPUser, ADPUserRole, ADPAccount
 from ..schemas import UserCreate, UserResponse, TokenWithUser
-from ..deps import hash_password, verify_password, create_access_token, get_current_user, get_user_roles
+from ..deps import (
+    authenticate_user,
+    create_access_token,
+    get_current_user,
+    get_user_roles,
+    hash_password,
+)
 
 router = APIRouter()
 
+# Built once at import; signup only binds the two values
+_IDENTITY_TAKEN_STMT = select(
+    exists().where(ADPUser.email == bindparam("email")),
+    exists().where(ADPUser.username == bindparam("username")),
+)
+
 
 @router.post("/signup", response_model=UserResponse, status_code=201)
 def signup(user_in: UserCreate, db: Session = Depends(get_db)):
-    # Check email exists
-    if db.query(ADPUser).filter(ADPUser.email == user_in.email).first():
-        raise HTTPException(status_code=400, detail="Email already registered")
+    if "@" in user_in.username:
+        raise HTTPException(status_code=400, detail="Username cannot contain '@'")
     
-    # Check username exists
-    if db.query(ADPUser).filter(ADPUser.username == user_in.username).first():
+    # Check email and username in one round trip, without loading a user row
+    email_taken, username_taken = db.execute(
+        _IDENTITY_TAKEN_STMT, {"email": user_in.email, "username": user_in.username}
+    ).one()
+    if email_taken:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    if username_taken:
         raise HTTPException(status_code=400, detail="Username already taken")
     
+    # Only after the checks, so rejected signups cost no KDF work
+    password_hash = hash_password(user_in.password)
+    
     try:
-        # Get next user_id
-        max_user_id = db.query(func.max(ADPUser.user_id)).scalar()
-        next_user_id = (max_user_id or 0) + 1
-        
-        # Create user
+        # Create user; flush assigns user_id from the identity
         user = ADPUser(
-            user_id=next_user_id,
             email=user_in.email,
             username=user_in.username,
-            password_hash=hash_password(user_in.password),
+            password_hash=password_hash,
             is_active=True,
         )
         db.add(user)
         db.flush()
         
         # Assign USER role
-        user_role = ADPUserRole(user_id=next_user_id, role_code="USER")
+        user_role = ADPUserRole(user_id=user.user_id, role_code="USER")
         db.add(user_role)
         
-        # Get next account_id
-        max_account_id = db.query(func.max(ADPAccount.account_id)).scalar()
-        next_account_id = (max_account_id or 0) + 1
-        
         # Create account with all address details
         account = ADPAccount(
-            account_id=next_account_id,
             first_name=user_in.first_name,
             last_name=user_in.last_name,
             address_line1=user_in.address_line1,
@@ -59,7 +69,7 @@ def signup(user_in: UserCreate, db: Session = Depends(get_db)):
             opened_date=date.today(),
             monthly_service_fee=Decimal("9.99"),
             adp_country_country_code=user_in.country_code,
-            adp_user_user_id=next_user_id,
+            adp_user_user_id=user.user_id,
         )
         db.add(account)
         
@@ -80,12 +90,9 @@ def signup(user_in: UserCreate, db: Session = Depends(get_db)):
 
 @router.post("/login", response_model=TokenWithUser)
 def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    # Find user by email or username
-    user = db.query(ADPUser).filter(
-        (ADPUser.email == form_data.username) | (ADPUser.username == form_data.username)
-    ).first()
-    
-    if not user or not verify_password(form_data.password, user.password_hash):
+    # Accepts email or username; legacy bcrypt hashes are upgraded on success
+    user = authenticate_user(db, form_data.username, form_data.password)
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email/username or password",
@@ -95,8 +102,16 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     if not user.is_active:
         raise HTTPException(status_code=403, detail="Account is deactivated")
     
-    roles = get_user_roles(user, db)
-    access_token = create_access_token(data={"sub": str(user.user_id)})
+    # Sent as-is: the fields are already the right types, so response_model
+    # validation would only repeat work.
+    body = {
+        "access_token": create_access_token(data={"sub": str(user.user_id)}),
+        "token_type": "bearer",
+        "user_id": user.user_id,
+        "username": user.username,
+        "email": user.email,
+        "roles": get_user_roles(user),
+    }
     
     # Update last login
     try:
@@ -105,19 +120,12 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     except:
         db.rollback()
     
-    return TokenWithUser(
-        access_token=access_token,
-        token_type="bearer",
-        user_id=user.user_id,
-        username=user.username,
-        email=user.email,
-        roles=roles,
-    )
+    return ORJSONResponse(body)
 
 
 @router.get("/me", response_model=UserResponse)
-def get_me(user: ADPUser = Depends(get_current_user), db: Session = Depends(get_db)):
-    roles = get_user_roles(user, db)
+def get_me(user: ADPUser = Depends(get_current_user)):
+    roles = get_user_roles(user)
     return UserResponse(
         user_id=user.user_id,
         email=user.email,
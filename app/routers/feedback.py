@@ -1,9 +1,9 @@
 from datetime import date
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from ..database import get_db
-from ..models import ADPUser, ADPAccount, ADPFeedback, ADPSeries
+from ..models import ADPUser, ADPFeedback, ADPSeries
 from ..schemas import FeedbackCreate, FeedbackListResponse, FeedbackResponse
 from ..deps import get_current_user
 
@@ -12,11 +12,13 @@ router = APIRouter()
 
 @router.get("/{series_id}/feedback", response_model=FeedbackListResponse)
 def get_series_feedback(series_id: int, db: Session = Depends(get_db)):
-    series = db.query(ADPSeries).filter(ADPSeries.series_id == series_id).first()
+    series = db.get(ADPSeries, series_id)
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
     
-    feedbacks = db.query(ADPFeedback).filter(
+    feedbacks = db.query(ADPFeedback).options(
+        joinedload(ADPFeedback.account), raiseload("*")
+    ).filter(
         ADPFeedback.adp_series_series_id == series_id
     ).all()
     
@@ -48,13 +50,13 @@ def add_feedback(
     if feedback_in.rating < 1 or feedback_in.rating > 5:
         raise HTTPException(status_code=400, detail="Rating must be 1-5")
     
-    # Get user's account
-    account = db.query(ADPAccount).filter(ADPAccount.adp_user_user_id == user.user_id).first()
+    # Get user's account (loaded with the user)
+    account = user.account
     if not account:
         raise HTTPException(status_code=400, detail="No account found for user")
     
     # Check series exists
-    series = db.query(ADPSeries).filter(ADPSeries.series_id == series_id).first()
+    series = db.get(ADPSeries, series_id)
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
     
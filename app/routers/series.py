@@ -1,16 +1,48 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, selectinload, undefer_group
 from typing import List, Optional
 
 from ..database import get_db
-from ..models import ADPSeries, ADPSeriesGenre, ADPSeriesType, ADPEpisode, ADPSeriesDub, ADPSeriesSub
+from ..models import (
+    ADPSeries, ADPSeriesGenre, ADPSeriesType, ADPEpisode, ADPSeriesDub, ADPSeriesSub,
+    ADPSeriesCountry, ADPFeedback, ADPWatchlist, ADPSchedule,
+)
 from ..schemas import SeriesCreate, SeriesUpdate, SeriesResponse, EpisodeResponse
 from ..deps import get_current_user, require_admin
 
 router = APIRouter()
 
+# Everything serialize_series reads; relationships are lazy="raise"
+_SERIES_LOADERS = (
+    selectinload(ADPSeries.genre_types),
+    selectinload(ADPSeries.dub_languages),
+    selectinload(ADPSeries.sub_languages),
+    selectinload(ADPSeries.episodes).undefer(ADPEpisode.synopsis),
+    undefer_group("detail"),
+)
 
+# Tables keyed by adp_series_series_id, cleared before the series is deleted
+_SERIES_CHILDREN = (
+    ADPSeriesGenre, ADPSeriesDub, ADPSeriesSub, ADPSeriesCountry,
+    ADPFeedback, ADPWatchlist, ADPEpisode,
+)
+
+
+def _load_series(db: Session, series_id: int) -> Optional[ADPSeries]:
+    return (
+        db.query(ADPSeries)
+        .options(*_SERIES_LOADERS)
+        .populate_existing()
+        .filter(ADPSeries.series_id == series_id)
+        .first()
+    )
+
+
+# Builds exactly the SeriesResponse fields, already JSON-ready, so the read
+# routes send it straight through ORJSONResponse instead of having FastAPI
+# validate every series (and episode) against the model again.
 def serialize_series(s: ADPSeries) -> dict:
     return {
         "series_id": s.series_id,
@@ -25,9 +57,9 @@ def serialize_series(s: ADPSeries) -> dict:
         "banner_url": s.banner_url,
         "avg_rating": float(s.average_rating) if s.average_rating else None,
         "rating_count": s.rating_count or 0,
-        "genres": [g.type.type_name for g in s.genres if g.type],
-        "dub_languages": [d.language.language_name for d in s.dubs if d.language],
-        "sub_languages": [sub.language.language_name for sub in s.subs if sub.language],
+        "genres": [t.type_name for t in s.genre_types],
+        "dub_languages": [l.language_name for l in s.dub_languages],
+        "sub_languages": [l.language_name for l in s.sub_languages],
         "episodes": [
             {
                 "episode_id": e.episode_id,
@@ -48,7 +80,7 @@ def get_series(
     language: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
-    query = db.query(ADPSeries)
+    query = db.query(ADPSeries).options(*_SERIES_LOADERS)
     
     if search:
         query = query.filter(ADPSeries.name.ilike(f"%{search}%"))
@@ -62,15 +94,15 @@ def get_series(
         )
     
     series_list = query.order_by(ADPSeries.average_rating.desc()).all()
-    return [serialize_series(s) for s in series_list]
+    return ORJSONResponse([serialize_series(s) for s in series_list])
 
 
 @router.get("/{series_id}", response_model=SeriesResponse)
 def get_series_by_id(series_id: int, db: Session = Depends(get_db)):
-    series = db.query(ADPSeries).filter(ADPSeries.series_id == series_id).first()
+    series = _load_series(db, series_id)
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
-    return serialize_series(series)
+    return ORJSONResponse(serialize_series(series))
 
 
 @router.post("", response_model=SeriesResponse, status_code=201)
@@ -80,12 +112,7 @@ def create_series(
     admin = Depends(require_admin),
 ):
     try:
-        # Get next ID
-        max_id = db.query(func.max(ADPSeries.series_id)).scalar()
-        next_id = (max_id or 0) + 1
-        
         series = ADPSeries(
-            series_id=next_id,
             name=series_in.name,
             num_episodes=series_in.num_episodes,
             release_date=series_in.release_date,
@@ -97,18 +124,17 @@ def create_series(
             banner_url=series_in.banner_url,
         )
         db.add(series)
+        db.flush()
         
-        # Add genres
-        for code in series_in.genre_codes:
-            genre = ADPSeriesGenre(
-                adp_series_series_id=next_id,
-                adp_series_type_type_code=code,
-            )
-            db.add(genre)
+        # Add genres in one executemany instead of an ORM object per row
+        if series_in.genre_codes:
+            db.execute(insert(ADPSeriesGenre), [
+                {"adp_series_series_id": series.series_id, "adp_series_type_type_code": code}
+                for code in series_in.genre_codes
+            ])
         
         db.commit()
-        db.refresh(series)
-        return serialize_series(series)
+        return serialize_series(_load_series(db, series.series_id))
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
@@ -121,46 +147,32 @@ def update_series(
     db: Session = Depends(get_db),
     admin = Depends(require_admin),
 ):
-    series = db.query(ADPSeries).filter(ADPSeries.series_id == series_id).first()
+    series = db.get(ADPSeries, series_id)
     
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
     
     try:
-        if series_in.name is not None:
-            series.name = series_in.name
-        if series_in.release_date is not None:
-            series.release_date = series_in.release_date
-        if series_in.language_code is not None:
-            series.adp_language_language_code = series_in.language_code
-        if series_in.origin_country is not None:
-            series.origin_country = series_in.origin_country
-        if series_in.num_episodes is not None:
-            series.num_episodes = series_in.num_episodes
-        if series_in.description is not None:
-            series.description = series_in.description
-        if series_in.maturity_rating is not None:
-            series.maturity_rating = series_in.maturity_rating
-        if series_in.poster_url is not None:
-            series.poster_url = series_in.poster_url
-        if series_in.banner_url is not None:
-            series.banner_url = series_in.banner_url
+        # Only fields the client actually sent; the flush UPDATEs just those
+        changes = series_in.model_dump(exclude_unset=True, exclude_none=True, exclude={"genre_codes"})
+        if "language_code" in changes:
+            changes["adp_language_language_code"] = changes.pop("language_code")
+        for field, value in changes.items():
+            setattr(series, field, value)
         
         # Update genres if provided
         if series_in.genre_codes is not None:
             db.query(ADPSeriesGenre).filter(
                 ADPSeriesGenre.adp_series_series_id == series_id
             ).delete()
-            for code in series_in.genre_codes:
-                genre = ADPSeriesGenre(
-                    adp_series_series_id=series_id,
-                    adp_series_type_type_code=code,
-                )
-                db.add(genre)
+            if series_in.genre_codes:
+                db.execute(insert(ADPSeriesGenre), [
+                    {"adp_series_series_id": series_id, "adp_series_type_type_code": code}
+                    for code in series_in.genre_codes
+                ])
         
         db.commit()
-        db.refresh(series)
-        return serialize_series(series)
+        return serialize_series(_load_series(db, series.series_id))
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
@@ -172,12 +184,25 @@ def delete_series(
     db: Session = Depends(get_db),
     admin = Depends(require_admin),
 ):
-    series = db.query(ADPSeries).filter(ADPSeries.series_id == series_id).first()
+    series = db.get(ADPSeries, series_id)
     
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
     
     try:
+        # Child rows go in one DELETE per table rather than being loaded for
+        # ORM cascade; explicit so databases created without ON DELETE
+        # CASCADE behave the same.
+        episode_ids = select(ADPEpisode.episode_id).where(
+            ADPEpisode.adp_series_series_id == series_id
+        )
+        db.query(ADPSchedule).filter(
+            ADPSchedule.adp_episode_episode_id.in_(episode_ids)
+        ).delete(synchronize_session=False)
+        for child in _SERIES_CHILDREN:
+            db.query(child).filter(
+                child.adp_series_series_id == series_id
+            ).delete(synchronize_session=False)
         db.delete(series)
         db.commit()
     except Exception as e:
@@ -29,12 +29,9 @@ def get_me(user: models.ADPUser = Depends(get_current_user)):
 
 
 @router.get("/me/roles", response_model=List[str])
-def get_my_roles(
-    db: Session = Depends(get_db),
-    user: models.ADPUser = Depends(get_current_user),
-):
+def get_my_roles(user: models.ADPUser = Depends(get_current_user)):
     """Get the roles of the current user."""
-    return get_user_roles(db, user.user_id)
+    return [r.role_code for r in user.roles]
 
 
 # -------------------------------------------------------------------------
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, raiseload
 from typing import List
 
 from ..database import get_db
-from ..models import ADPUser, ADPAccount, ADPWatchlist, ADPSeries
+from ..models import ADPUser, ADPWatchlist, ADPSeries
 from ..schemas import WatchlistItem
 from ..deps import get_current_user
 
@@ -12,11 +12,14 @@ router = APIRouter()
 
 @router.get("/watchlist", response_model=List[WatchlistItem])
 def get_watchlist(user: ADPUser = Depends(get_current_user), db: Session = Depends(get_db)):
-    account = db.query(ADPAccount).filter(ADPAccount.adp_user_user_id == user.user_id).first()
+    account = user.account
     if not account:
         return []
     
-    items = db.query(ADPWatchlist).filter(
+    items = db.query(ADPWatchlist).options(
+        joinedload(ADPWatchlist.series).undefer(ADPSeries.poster_url),
+        raiseload("*"),
+    ).filter(
         ADPWatchlist.adp_account_account_id == account.account_id
     ).all()
     
@@ -37,19 +40,16 @@ def add_to_watchlist(
     user: ADPUser = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    account = db.query(ADPAccount).filter(ADPAccount.adp_user_user_id == user.user_id).first()
+    account = user.account
     if not account:
         raise HTTPException(status_code=400, detail="No account found")
     
-    series = db.query(ADPSeries).filter(ADPSeries.series_id == series_id).first()
+    series = db.get(ADPSeries, series_id)
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
     
     # Check if already in watchlist
-    existing = db.query(ADPWatchlist).filter(
-        ADPWatchlist.adp_account_account_id == account.account_id,
-        ADPWatchlist.adp_series_series_id == series_id,
-    ).first()
+    existing = db.get(ADPWatchlist, (account.account_id, series_id))
     
     if existing:
         raise HTTPException(status_code=400, detail="Already in watchlist")
@@ -73,14 +73,11 @@ def remove_from_watchlist(
     user: ADPUser = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    account = db.query(ADPAccount).filter(ADPAccount.adp_user_user_id == user.user_id).first()
+    account = user.account
     if not account:
         raise HTTPException(status_code=400, detail="No account found")
     
-    item = db.query(ADPWatchlist).filter(
-        ADPWatchlist.adp_account_account_id == account.account_id,
-        ADPWatchlist.adp_series_series_id == series_id,
-    ).first()
+    item = db.get(ADPWatchlist, (account.account_id, series_id))
     
     if not item:
         raise HTTPException(status_code=404, detail="Not in watchlist")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, List
 from datetime import date, datetime
 
@@ -7,7 +7,8 @@ from datetime import date, datetime
 class UserCreate(BaseModel):
     email: EmailStr
     username: str
-    password: str
+    # Same bounds login verifies against (auth._MAX_PASSWORD_LEN)
+    password: str = Field(min_length=1, max_length=1024)
     first_name: str
     last_name: str
     address_line1: str
@@ -38,6 +39,10 @@ class Token(BaseModel):
     token_type: str
 
 
+class TokenData(BaseModel):
+    user_id: Optional[int] = None
+
+
 class TokenWithUser(Token):
     user_id: int
     username: str
@@ -51,7 +56,7 @@ class SeriesCreate(BaseModel):
     release_date: date
     language_code: str
     origin_country: str
-    num_episodes: int = 0
+    num_episodes: int = Field(default=0, ge=0, le=32767)  # SMALLINT
     description: Optional[str] = None
     maturity_rating: Optional[str] = None
     poster_url: Optional[str] = None
@@ -64,7 +69,7 @@ class SeriesUpdate(BaseModel):
     release_date: Optional[date] = None
     language_code: Optional[str] = None
     origin_country: Optional[str] = None
-    num_episodes: Optional[int] = None
+    num_episodes: Optional[int] = Field(default=None, ge=0, le=32767)
     description: Optional[str] = None
     maturity_rating: Optional[str] = None
     poster_url: Optional[str] = None